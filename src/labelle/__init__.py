@@ -1,4 +1,21 @@
-from labelle.lib.devices.dymo_labeler import DymoLabeler
-from labelle.metadata import __version__
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from labelle.lib.devices.dymo_labeler import DymoLabeler
+    from labelle.metadata import __version__
 
 __all__ = ["DymoLabeler", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve the public names lazily, so that importing a submodule (e.g. the CLI
+    # entry point) does not drag in PIL and pyusb before they are actually needed.
+    if name == "DymoLabeler":
+        from labelle.lib.devices.dymo_labeler import DymoLabeler
+
+        return DymoLabeler
+    if name == "__version__":
+        from labelle.metadata import __version__
+
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
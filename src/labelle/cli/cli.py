@@ -7,15 +7,17 @@
 # === END LICENSE STATEMENT ===
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, NoReturn, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, NoReturn, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from typing_extensions import Annotated
 
-from labelle import __version__
+if sys.version_info >= (3, 9):
+    from typing import Annotated
+else:
+    from typing_extensions import Annotated
+
 from labelle.lib.constants import (
     DEFAULT_BARCODE_TYPE,
     DEFAULT_MARGIN_PX,
@@ -26,31 +28,12 @@ from labelle.lib.constants import (
     Output,
     e_qrcode,
 )
-from labelle.lib.devices.device_manager import DeviceManager, DeviceManagerNoDevices
-from labelle.lib.devices.dymo_labeler import DymoLabeler
 from labelle.lib.env_config import is_verbose_env_vars
-from labelle.lib.font_config import (
-    DefaultFontStyle,
-    FontStyle,
-    NoFontFound,
-    get_available_fonts,
-    get_font_path,
-)
+from labelle.lib.font_config import DefaultFontStyle, FontStyle
 from labelle.lib.logger import configure_logging, set_not_verbose
-from labelle.lib.outputs import output_bitmap
-from labelle.lib.render_engines import (
-    BarcodeRenderEngine,
-    BarcodeWithTextRenderEngine,
-    HorizontallyCombinedRenderEngine,
-    PictureRenderEngine,
-    PrintPayloadRenderEngine,
-    PrintPreviewRenderEngine,
-    QrRenderEngine,
-    RenderContext,
-    RenderEngine,
-    SamplePatternRenderEngine,
-    TextRenderEngine,
-)
+
+if TYPE_CHECKING:
+    from labelle.lib.devices.device_manager import DeviceManager
 
 LOG = logging.getLogger(__name__)
 
@@ -63,9 +46,15 @@ def mm_to_payload_px(mm: float, margin: float) -> float:
     return max(0, (mm * PIXELS_PER_MM) - margin * 2)
 
 
+def print_version() -> None:
+    from labelle import __version__
+
+    typer.echo(f"Labelle: {__version__}")
+
+
 def version_callback(value: bool) -> None:
     if value:
-        typer.echo(f"Labelle: {__version__}")
+        print_version()
         raise typer.Exit()
 
 
@@ -78,7 +67,14 @@ def qr_callback(qr_content: str) -> str:
     return qr_content
 
 
-def get_device_manager() -> DeviceManager:
+def get_device_manager() -> "DeviceManager":
+    from rich.console import Console
+
+    from labelle.lib.devices.device_manager import (
+        DeviceManager,
+        DeviceManagerNoDevices,
+    )
+
     device_manager = DeviceManager()
     try:
         device_manager.scan()
@@ -89,15 +85,55 @@ def get_device_manager() -> DeviceManager:
     return device_manager
 
 
-app = typer.Typer()
+# Old dymoprint arguments, together with the error raised when they are used
+_DEPRECATED_PARAMS = (
+    ("preview", "The --preview / -n flag is deprecated. Use --output=console instead."),
+    (
+        "preview_inverted",
+        "The --preview-inverted flag is deprecated. Use "
+        "--output=console-inverted instead.",
+    ),
+    (
+        "imagemagick",
+        "The --imagemagick flag is deprecated. Use --output=imagemagick instead.",
+    ),
+    ("old_help", "The -h flag is deprecated. Use --help instead."),
+    ("old_frame", "The -f flag is deprecated. Use --frame-width-px instead."),
+    ("old_style", "The -s flag is deprecated. Use --style instead."),
+    ("old_align", "The -a flag is deprecated. Use --align instead."),
+    ("old_font", "The -u flag is deprecated. Use --font instead."),
+    ("old_barcode", "The -c flag is deprecated. Use --barcode instead."),
+    (
+        "barcode_text",
+        "The --barcode-text flag is deprecated. Use --barcode-with-text instead.",
+    ),
+    ("old_picture", "The -p flag is deprecated. Use --picture instead."),
+    ("old_margin", "The -m flag is deprecated. Use --margin-px instead."),
+    ("scale", "The --scale flag is deprecated. Use --font-scale instead."),
+    ("old_tape_size", "The -t flag is deprecated. Use --tape-size-mm instead."),
+    ("old_min_length", "The -l flag is deprecated. Use --min-length instead."),
+    ("old_justify", "The -j flag is deprecated. Use --justify instead."),
+    (
+        "test_pattern",
+        "The --test-pattern flag is deprecated. Use --sample-pattern instead.",
+    ),
+)
+
+
+_DEVICE_TABLE_HEADERS = ("Manufacturer", "Product", "Serial Number", "USB")
+
+
+app = typer.Typer(no_args_is_help=True)
 
 
 @app.command(hidden=True)
 def list_devices() -> NoReturn:
+    from rich.console import Console
+    from rich.table import Table
+
     device_manager = get_device_manager()
     console = Console()
-    headers = ["Manufacturer", "Product", "Serial Number", "USB"]
-    table = Table(*headers, show_header=True)
+    table = Table(*_DEVICE_TABLE_HEADERS, show_header=True)
     for device in device_manager.devices:
         table.add_row(
             device.manufacturer, device.product, device.serial_number, device.usb_id
@@ -379,70 +415,41 @@ def default(
     if ctx.invoked_subcommand is not None:
         return
 
+    from rich.console import Console
+
+    from labelle.lib.devices.dymo_labeler import DymoLabeler
+    from labelle.lib.font_config import NoFontFound, get_available_fonts, get_font_path
+    from labelle.lib.render_engines import (
+        BarcodeRenderEngine,
+        BarcodeWithTextRenderEngine,
+        HorizontallyCombinedRenderEngine,
+        PictureRenderEngine,
+        QrRenderEngine,
+        RenderContext,
+        RenderEngine,
+        SamplePatternRenderEngine,
+        TextRenderEngine,
+    )
+
     if (not verbose) and (not is_verbose_env_vars()):
         # Neither --verbose flag nor the environment variable is set.
         set_not_verbose()
 
     # Raise informative errors with old dymoprint arguments
-    if preview:
-        raise typer.BadParameter(
-            "The --preview / -n flag is deprecated. Use --output=console instead."
-        )
-    if preview_inverted:
-        raise typer.BadParameter(
-            "The --preview-inverted flag is deprecated. Use "
-            "--output=console-inverted instead."
-        )
-    if imagemagick:
-        raise typer.BadParameter(
-            "The --imagemagick flag is deprecated. Use --output=imagemagick instead."
-        )
-    if old_help:
-        raise typer.BadParameter("The -h flag is deprecated. Use --help instead.")
-    if old_frame:
-        raise typer.BadParameter(
-            "The -f flag is deprecated. Use --frame-width-px instead."
-        )
-    if old_style is not None:
-        raise typer.BadParameter("The -s flag is deprecated. Use --style instead.")
-    if old_align is not None:
-        raise typer.BadParameter("The -a flag is deprecated. Use --align instead.")
-    if old_font is not None:
-        raise typer.BadParameter("The -u flag is deprecated. Use --font instead.")
-    if old_barcode is not None:
-        raise typer.BadParameter("The -c flag is deprecated. Use --barcode instead.")
-    if barcode_text is not None:
-        raise typer.BadParameter(
-            "The --barcode-text flag is deprecated. Use --barcode-with-text instead."
-        )
-    if old_picture is not None:
-        raise typer.BadParameter("The -p flag is deprecated. Use --picture instead.")
-    if old_margin is not None:
-        raise typer.BadParameter("The -m flag is deprecated. Use --margin-px instead.")
-    if scale is not None:
-        raise typer.BadParameter(
-            "The --scale flag is deprecated. Use --font-scale instead."
-        )
-    if old_tape_size is not None:
-        raise typer.BadParameter(
-            "The -t flag is deprecated. Use --tape-size-mm instead."
-        )
-    if old_min_length is not None:
-        raise typer.BadParameter("The -l flag is deprecated. Use --min-length instead.")
-    if old_justify is not None:
-        raise typer.BadParameter("The -j flag is deprecated. Use --justify instead.")
-    if test_pattern is not None:
-        raise typer.BadParameter(
-            "The --test-pattern flag is deprecated. Use --sample-pattern instead."
-        )
-
-    # read config file
-    try:
-        font_path = get_font_path(font=font, style=style)
-    except NoFontFound as e:
-        valid_font_names = [f.stem for f in get_available_fonts()]
-        msg = f"{e}. Valid fonts are: {', '.join(valid_font_names)}"
-        raise typer.BadParameter(msg) from None
+    for param_name, msg in _DEPRECATED_PARAMS:
+        value = ctx.params.get(param_name)
+        if value is not None and value is not False:
+            raise typer.BadParameter(msg)
+
+    # The font is only resolved once an element that renders text needs it
+    @lru_cache
+    def get_text_font_path() -> Path:
+        try:
+            return get_font_path(font=font, style=style)
+        except NoFontFound as e:
+            valid_font_names = [f.stem for f in get_available_fonts()]
+            msg = f"{e}. Valid fonts are: {', '.join(valid_font_names)}"
+            raise typer.BadParameter(msg) from None
 
     if barcode_with_text_content and barcode_content:
         raise typer.BadParameter(
@@ -477,7 +484,7 @@ def default(
             BarcodeWithTextRenderEngine(
                 content=barcode_with_text_content,
                 barcode_type=barcode_type,
-                font_file_name=font_path,
+                font_file_name=get_text_font_path(),
                 frame_width_px=frame_width_px,
             )
         )
@@ -487,13 +494,15 @@ def default(
             BarcodeRenderEngine(content=barcode_content, barcode_type=barcode_type)
         )
 
+    font_size_ratio = int(font_scale) / 100.0
+
     def render_text(lines):
         render_engines.append(
             TextRenderEngine(
                 text_lines=lines,
-                font_file_name=font_path,
+                font_file_name=get_text_font_path(),
                 frame_width_px=frame_width_px,
-                font_size_ratio=int(font_scale) / 100.0,
+                font_size_ratio=font_size_ratio,
                 align=align,
             )
         )
@@ -581,28 +590,23 @@ def default(
         else None
     )
 
-    if output == Output.PRINTER:
-        device_manager = get_device_manager()
-        device = device_manager.find_and_select_device(patterns=device_pattern)
-        device.setup()
-    else:
-        device = None
-
-    dymo_labeler = DymoLabeler(tape_size_mm=tape_size_mm, device=device)
     if not render_engines:
         raise typer.BadParameter("No elements to print")
-    render_engine = HorizontallyCombinedRenderEngine(render_engines)
-    render_context = RenderContext(
-        background_color="white",
-        foreground_color="black",
-        height_px=dymo_labeler.height_px,
-        preview_show_margins=False,
+    render_engine = (
+        render_engines[0]
+        if len(render_engines) == 1
+        else HorizontallyCombinedRenderEngine(render_engines)
     )
 
     # print or show the label
-    render: RenderEngine
     if output == Output.PRINTER:
-        render = PrintPayloadRenderEngine(
+        from labelle.lib.render_engines import PrintPayloadRenderEngine
+
+        device_manager = get_device_manager()
+        device = device_manager.find_and_select_device(patterns=device_pattern)
+        device.setup()
+        dymo_labeler = DymoLabeler(tape_size_mm=tape_size_mm, device=device)
+        payload_render_engine = PrintPayloadRenderEngine(
             render_engine=render_engine,
             justify=justify,
             visible_horizontal_margin_px=margin_px,
@@ -610,10 +614,20 @@ def default(
             max_width_px=max_payload_len_px,
             min_width_px=min_payload_len_px,
         )
-        bitmap, _ = render.render_with_meta(render_context)
+        render_context = RenderContext(
+            background_color="white",
+            foreground_color="black",
+            height_px=dymo_labeler.height_px,
+            preview_show_margins=False,
+        )
+        bitmap, _ = payload_render_engine.render_with_meta(render_context)
         dymo_labeler.print(bitmap)
     else:
-        render = PrintPreviewRenderEngine(
+        from labelle.lib.outputs import output_bitmap
+        from labelle.lib.render_engines import PrintPreviewRenderEngine
+
+        dymo_labeler = DymoLabeler(tape_size_mm=tape_size_mm)
+        preview_render_engine = PrintPreviewRenderEngine(
             render_engine=render_engine,
             justify=justify,
             visible_horizontal_margin_px=margin_px,
@@ -621,11 +635,27 @@ def default(
             max_width_px=max_payload_len_px,
             min_width_px=min_payload_len_px,
         )
-        bitmap = render.render(render_context)
+        render_context = RenderContext(
+            background_color="white",
+            foreground_color="black",
+            height_px=dymo_labeler.height_px,
+            preview_show_margins=False,
+        )
+        bitmap = preview_render_engine.render(render_context)
         output_bitmap(bitmap, output)
 
 
+# Invocations that can be answered without parsing any other option. They are
+# looked up directly in argv, so Typer never builds the Click command for them.
+_FAST_PATH_COMMANDS: Dict[str, Callable[[], None]] = {
+    "--version": print_version,
+}
+
+
 def main() -> None:
+    if len(sys.argv) == 2 and sys.argv[1] in _FAST_PATH_COMMANDS:
+        _FAST_PATH_COMMANDS[sys.argv[1]]()
+        return
     configure_logging()
     app()
 
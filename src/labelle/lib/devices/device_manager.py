@@ -76,8 +76,11 @@ class DeviceManager:
             LOG.debug("Found multiple matching Dymo devices. Using first device")
         else:
             LOG.debug("Found single device")
-        for dev in devices:
-            LOG.debug(dev.device_info)
+        if LOG.isEnabledFor(logging.DEBUG):
+            # device_info reads string descriptors and walks the configurations of
+            # every matching device, so only collect it when it will be logged.
+            for dev in devices:
+                LOG.debug(dev.device_info)
         dev = devices[0]
         if dev.is_supported:
             msg = f"Recognized device as {SUPPORTED_PRODUCTS[dev.id_product]}"
@@ -1,10 +1,13 @@
+import json
 import logging
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from tempfile import NamedTemporaryFile
+from typing import Dict, Iterable, List, Optional
+
+from platformdirs import user_cache_dir
 
 import labelle.resources.fonts
-from labelle._vendor.matplotlib import font_manager
 from labelle.lib.config_file import get_config_section
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,7 @@ _DEFAULT_STYLES_TO_FONT_PATH: Dict[str, Path] = {
     "italic": _DEFAULT_FONTS_DIR / "Carlito-Italic.ttf",
     "narrow": _DEFAULT_FONTS_DIR / "Carlito-BoldItalic.ttf",
 }
+_FONTS_CACHE_FILE = Path(user_cache_dir("labelle")) / "fonts.json"
 
 
 class FontStyle(str, Enum):
@@ -90,15 +94,65 @@ def _path_from_name(name: str) -> Path:
     The name should be the name of the font file, without the extension.
     It is case-insensitive.
     """
-    available_fonts = get_available_fonts()
-    matching_fonts = [f for f in available_fonts if name.lower() == f.stem.lower()]
-    if len(matching_fonts) == 0:
+    fonts_by_name = _read_fonts_cache()
+    if fonts_by_name is None or name.lower() not in fonts_by_name:
+        fonts_by_name = _write_fonts_cache(get_available_fonts())
+    if name.lower() not in fonts_by_name:
         raise NoFontFound(name)
-    return matching_fonts[0]
+    return Path(fonts_by_name[name.lower()])
+
+
+def _get_dir_mtimes(dirs: Iterable[str]) -> Dict[str, int]:
+    mtimes = {}
+    for directory in dirs:
+        try:
+            mtimes[directory] = Path(directory).stat().st_mtime_ns
+        except OSError:
+            mtimes[directory] = -1
+    return mtimes
+
+
+def _read_fonts_cache() -> Optional[Dict[str, str]]:
+    """Read the cached lookup table from font names to font paths.
+
+    Searching the system fonts is slow, so the result is cached on disk. The cache
+    is discarded as soon as any directory containing fonts has been modified.
+    """
+    try:
+        cache = json.loads(_FONTS_CACHE_FILE.read_text())
+        dir_mtimes = cache["dirs"]
+        fonts_by_name = cache["fonts"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if _get_dir_mtimes(dir_mtimes) != dir_mtimes:
+        logger.debug("Font cache is outdated")
+        return None
+    return fonts_by_name
+
+
+def _write_fonts_cache(available_fonts: List[Path]) -> Dict[str, str]:
+    """Build the lookup table from font names to font paths and cache it on disk."""
+    fonts_by_name: Dict[str, str] = {}
+    for font_path in available_fonts:
+        fonts_by_name.setdefault(font_path.stem.lower(), str(font_path))
+    dirs = sorted({str(font_path.parent) for font_path in available_fonts})
+    cache = {"dirs": _get_dir_mtimes(dirs), "fonts": fonts_by_name}
+    try:
+        _FONTS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(
+            "w", dir=_FONTS_CACHE_FILE.parent, suffix=".tmp", delete=False
+        ) as fp:
+            json.dump(cache, fp)
+        Path(fp.name).replace(_FONTS_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write font cache: {e}")
+    return fonts_by_name
 
 
 def get_available_fonts() -> List[Path]:
     """Get a list of available font files."""
+    from labelle._vendor.matplotlib import font_manager
+
     fonts = [f for f in _DEFAULT_FONTS_DIR.iterdir() if f.suffix == ".ttf"]
     fonts.extend(Path(f) for f in font_manager.findSystemFonts())
     return sorted(fonts, key=lambda f: f.stem.lower())
@@ -1,5 +1,6 @@
 import webbrowser
 from tempfile import NamedTemporaryFile
+from typing import Callable, Dict
 
 import typer
 from PIL import Image, ImageOps
@@ -8,18 +9,41 @@ from labelle.lib.constants import Output
 from labelle.lib.unicode_blocks import image_to_unicode
 
 
+def _output_console(bitmap: Image.Image, invert: bool = False):
+    label_rotated = bitmap.transpose(Image.Transpose.ROTATE_270)
+    typer.echo(image_to_unicode(label_rotated, invert=invert))
+
+
+def _output_console_inverted(bitmap: Image.Image):
+    _output_console(bitmap, invert=True)
+
+
+def _output_imagemagick(bitmap: Image.Image):
+    ImageOps.invert(bitmap.convert("RGB")).show()
+
+
+def _output_browser(bitmap: Image.Image):
+    with NamedTemporaryFile(suffix=".png", delete=False) as fp:
+        # The file is only opened once by the browser, so favor speed over size
+        bitmap.convert("RGB").save(fp, format="PNG", compress_level=1)
+        webbrowser.open(f"file://{fp.name}")
+
+
+def _output_png(bitmap: Image.Image):
+    bitmap.save("output.png")
+    typer.echo("Saved output.png")
+
+
+_OUTPUT_HANDLERS: Dict[Output, Callable[[Image.Image], None]] = {
+    Output.BROWSER: _output_browser,
+    Output.CONSOLE: _output_console,
+    Output.CONSOLE_INVERTED: _output_console_inverted,
+    Output.IMAGEMAGICK: _output_imagemagick,
+    Output.PNG: _output_png,
+}
+
+
 def output_bitmap(bitmap: Image.Image, output: Output):
-    if output in (Output.CONSOLE, Output.CONSOLE_INVERTED):
-        label_rotated = bitmap.transpose(Image.Transpose.ROTATE_270)
-        invert = output == Output.CONSOLE_INVERTED
-        typer.echo(image_to_unicode(label_rotated, invert=invert))
-    if output == Output.IMAGEMAGICK:
-        ImageOps.invert(bitmap.convert("RGB")).show()
-    if output == Output.BROWSER:
-        with NamedTemporaryFile(suffix=".png", delete=False) as fp:
-            inverted = ImageOps.invert(bitmap.convert("RGB"))
-            ImageOps.invert(inverted).save(fp)
-            webbrowser.open(f"file://{fp.name}")
-    if output == Output.PNG:
-        bitmap.save("output.png")
-        typer.echo("Saved output.png")
+    if output not in _OUTPUT_HANDLERS:
+        raise ValueError(f"Unsupported output for a bitmap: {output}")
+    _OUTPUT_HANDLERS[output](bitmap)
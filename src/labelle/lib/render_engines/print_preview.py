@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from darkdetect import isDark
-from PIL import Image, ImageColor, ImageDraw, ImageOps
+from PIL import Image, ImageColor, ImageDraw
 
 from labelle.lib.constants import Direction
 from labelle.lib.render_engines.margins import MarginsRenderEngine
@@ -50,20 +50,17 @@ class PrintPreviewRenderEngine(RenderEngine):
 
     def _get_label_bitmap(self, context: RenderContext):
         render_bitmap, meta = self.render_engine.render_with_meta(context)
-        bitmap = ImageOps.invert(render_bitmap.convert("L")).convert("RGBA")
-        pixel_map = {
-            "black": context.foreground_color,
-            "white": context.background_color,
-        }
-        pixel_color_map = {
-            ImageColor.getcolor(k, "RGBA"): ImageColor.getcolor(v, "RGBA")
-            for k, v in pixel_map.items()
-        }
-        pixdata = bitmap.load()
-        width, height = bitmap.size
-        for x in range(0, width):
-            for y in range(0, height):
-                pixdata[x, y] = pixel_color_map[pixdata[x, y]]
+        # Fill with the background color, then paint the foreground color through
+        # the printed pixels, instead of recoloring the bitmap pixel by pixel.
+        bitmap = Image.new(
+            "RGBA",
+            render_bitmap.size,
+            ImageColor.getcolor(context.background_color, "RGBA"),
+        )
+        bitmap.paste(
+            ImageColor.getcolor(context.foreground_color, "RGBA"),
+            mask=render_bitmap.convert("L"),
+        )
         return bitmap, meta
 
     def _show_margins(self, label_bitmap, preview_bitmap, meta, context):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from PIL import Image, ImageFont
@@ -10,6 +11,12 @@ from labelle.lib.render_engines.render_engine import RenderEngine
 from labelle.lib.utils import draw_image
 
 
+@lru_cache
+def _get_font(font_file_name: str, font_size_px: int) -> ImageFont.FreeTypeFont:
+    """Load a font, reusing it across renders with the same font file and size."""
+    return ImageFont.truetype(font_file_name, font_size_px)
+
+
 class TextRenderEngine(RenderEngine):
     def __init__(
         self,
@@ -46,7 +53,7 @@ class TextRenderEngine(RenderEngine):
         else:
             frame_width_px = self.frame_width_px
 
-        font = ImageFont.truetype(str(self.font_file_name), font_size_px)
+        font = _get_font(str(self.font_file_name), font_size_px)
         boxes = (font.getbbox(line) for line in self.text_lines)
         line_widths = (right - left for left, _top, right, _bottom in boxes)
         label_width_px = max(line_widths) + (font_offset_px * 2)
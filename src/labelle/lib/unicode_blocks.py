@@ -1,5 +1,4 @@
 from PIL.Image import Image
-from PIL.ImageOps import pad
 
 UH = "▀"
 LH = "▄"
@@ -11,41 +10,29 @@ assert LH == "\N{LOWER HALF BLOCK}"
 assert FB == "\N{FULL BLOCK}"
 assert NB == "\N{NO-BREAK SPACE}"
 
-BLACK_PIXEL = (255, 255, 255, 255)
-WHITE_PIXEL = (0, 0, 0, 255)
-# when the image height is odd, the preview image height is extended by 1 pixel
-# this padding result in the added line being composed of transparent pixels.
-TRANSPARENT_PIXEL = (0, 0, 0, 0)
+# Lookup tables reducing a grayscale pixel to a single bit: 1 for a light pixel
+# (rendered as a block), 0 for a dark one. The inverted table does the opposite.
+_PIXEL_BITS = bytes(int(value >= 128) for value in range(256))
+_PIXEL_BITS_INVERTED = bytes(int(value < 128) for value in range(256))
 
-dict_unicode = {
-    (BLACK_PIXEL, BLACK_PIXEL): FB,
-    (WHITE_PIXEL, BLACK_PIXEL): LH,
-    (BLACK_PIXEL, WHITE_PIXEL): UH,
-    (WHITE_PIXEL, WHITE_PIXEL): NB,
-    (BLACK_PIXEL, TRANSPARENT_PIXEL): UH,
-    (WHITE_PIXEL, TRANSPARENT_PIXEL): NB,
-}
-
-dict_unicode_inverted = {
-    (BLACK_PIXEL, BLACK_PIXEL): NB,
-    (WHITE_PIXEL, BLACK_PIXEL): UH,
-    (BLACK_PIXEL, WHITE_PIXEL): LH,
-    (WHITE_PIXEL, WHITE_PIXEL): FB,
-    (BLACK_PIXEL, TRANSPARENT_PIXEL): NB,
-    (WHITE_PIXEL, TRANSPARENT_PIXEL): UH,
-}
+# Each character covers two pixel rows: bit 0 is the upper pixel, bit 1 the lower.
+_CHAR_FOR_PIXEL_PAIR = {0: NB, 1: UH, 2: LH, 3: FB}
 
 
 def image_to_unicode(im: Image, invert: bool = False) -> str:
-    char_for = dict_unicode_inverted if invert else dict_unicode
+    pixel_bits = _PIXEL_BITS_INVERTED if invert else _PIXEL_BITS
     width = im.width
-    height = im.height + (im.height % 2)
-    padded_im = pad(image=im, size=(width, height))
-    a = padded_im.load()
+    data = im.convert("L").tobytes().translate(pixel_bits)
+    rows = [data[i : i + width] for i in range(0, len(data), width)]
+    if len(rows) % 2:
+        # when the image height is odd, the preview is extended by an empty row
+        rows.append(bytes(width))
     output_rows = []
-    for r in range(0, height, 2):
-        char_list = [char_for[(a[c, r], a[c, r + 1])] for c in range(width)]
-        row = "".join(char_list)
-        output_rows.append(row)
+    for upper, lower in zip(rows[::2], rows[1::2]):
+        # Every byte holds a single bit, so a whole row pair can be merged in one
+        # integer operation without carries between neighbouring pixels.
+        pairs = int.from_bytes(upper, "big") | (int.from_bytes(lower, "big") << 1)
+        row = pairs.to_bytes(width, "big").decode("latin-1")
+        output_rows.append(row.translate(_CHAR_FOR_PIXEL_PAIR))
     output_str = "\n".join(output_rows)
     return output_str